@@ -1,15 +1,210 @@
 import numpy as np
+from numba import njit, prange
+from scipy.integrate import solve_ivp
 
 
-def calculate_ddt(theta, r, w, phi, nu, R, alpha):
-    """Given the current state variables theta, r and network parameters
-    w, phi, nu, R, alpha, calculate the time derivatives of theta and r."""
-    intrinsic_term = 2 * np.pi * nu
-    phase_diff = theta[np.newaxis, :] - theta[:, np.newaxis]
-    coupling_term = (r * w * np.sin(phase_diff - phi)).sum(axis=1)
-    dtheta_dt = intrinsic_term + coupling_term
-    dr_dt = alpha * (R - r)
-    return dtheta_dt, dr_dt
+def _derived_params(
+    timestep,
+    intrinsic_freqs,
+    intrinsic_amps,
+    coupling_weights,
+    phase_biases,
+    convergence_coefs,
+):
+    """Precompute the constant terms used by the kernels from the network
+    parameters. Works for a single network, shapes (N,) and (N, N), and for
+    a batch, shapes (K, N) and (K, N, N).
+
+    Returns w*cos(phi), w*sin(phi), omega = 2*pi*nu, alpha*R and the
+    per-step magnitude decay exp(-alpha * dt)."""
+    # The phase biases are fixed, so their trigonometric terms can be
+    # folded into the coupling weights once
+    w_cos_phi = coupling_weights * np.cos(phase_biases)
+    w_sin_phi = coupling_weights * np.sin(phase_biases)
+    omega = 2 * np.pi * intrinsic_freqs
+    alpha_R = convergence_coefs * intrinsic_amps
+    decay = np.exp(-convergence_coefs * timestep)
+    return w_cos_phi, w_sin_phi, omega, alpha_R, decay
+
+
+@njit(cache=True, fastmath=True)
+def _phase_derivative(theta, r, w_cos_phi, w_sin_phi, omega, out):
+    """Write dtheta/dt into out, shape (N,).
+
+    The coupling term sin(theta_j - theta_i - phi_ij) is expanded as
+    sin(theta_j - theta_i) cos(phi_ij) - cos(theta_j - theta_i) sin(phi_ij)
+    so that the phase biases only enter through the precomputed weights
+    w*cos(phi) and w*sin(phi)."""
+    num_cpgs = theta.shape[0]
+    for i in range(num_cpgs):
+        coupling = 0.0
+        for j in range(num_cpgs):
+            d = theta[j] - theta[i]
+            coupling += r[j] * (
+                np.sin(d) * w_cos_phi[i, j] - np.cos(d) * w_sin_phi[i, j]
+            )
+        out[i] = omega[i] + coupling
+
+
+@njit(cache=True)
+def cpg_rhs(t, y, w_cos_phi, w_sin_phi, omega, alpha, alpha_R):
+    """Right-hand side of the CPG ODEs in the form expected by
+    ``scipy.integrate.solve_ivp``. The state y of shape (2N,) holds the
+    phases in y[:N] and the magnitudes in y[N:]. omega = 2*pi*nu and
+    alpha_R = alpha*R are precomputed from the network parameters."""
+    num_cpgs = omega.shape[0]
+    theta = y[:num_cpgs]
+    r = y[num_cpgs:]
+    dy_dt = np.empty(2 * num_cpgs)
+    _phase_derivative(theta, r, w_cos_phi, w_sin_phi, omega, dy_dt[:num_cpgs])
+    for i in range(num_cpgs):
+        dy_dt[num_cpgs + i] = alpha_R[i] - alpha[i] * r[i]
+    return dy_dt
+
+
+@njit(cache=True, fastmath=True)
+def _cpg_step(theta, r, w_cos_phi, w_sin_phi, omega, R, decay, dt, dtheta_dt):
+    """Advance theta and r in place by one step of size dt.
+
+    The phases take an Euler step of dtheta_i/dt = omega_i +
+    sum_j r_j w_ij sin(theta_j - theta_i - phi_ij), with omega = 2*pi*nu,
+    computed by ``_phase_derivative`` without creating temporary arrays
+    for the N x N phase differences. The magnitudes follow
+    dr/dt = alpha * (R - r), whose exact solution over one step is
+    r <- R + (r - R) * exp(-alpha * dt); ``decay`` holds exp(-alpha * dt).
+    ``dtheta_dt`` is a scratch buffer of shape (N,) that is overwritten."""
+    _phase_derivative(theta, r, w_cos_phi, w_sin_phi, omega, dtheta_dt)
+    for i in range(theta.shape[0]):
+        theta[i] += dtheta_dt[i] * dt
+        r[i] = R[i] + (r[i] - R[i]) * decay[i]
+
+
+@njit(cache=True)
+def _rollout(
+    theta, r, w_cos_phi, w_sin_phi, omega, R, decay, dt, num_steps, out_theta, out_r
+):
+    """Advance theta and r in place by num_steps steps of ``_cpg_step``,
+    writing the state after each step into out_theta and out_r, both of
+    shape (num_steps, N)."""
+    dtheta_dt = np.empty(theta.shape[0])
+    for step in range(num_steps):
+        _cpg_step(theta, r, w_cos_phi, w_sin_phi, omega, R, decay, dt, dtheta_dt)
+        out_theta[step, :] = theta
+        out_r[step, :] = r
+
+
+@njit(cache=True, parallel=True)
+def _rollout_batch(
+    theta0s,
+    r0s,
+    w_cos_phis,
+    w_sin_phis,
+    omegas,
+    Rs,
+    decays,
+    dt,
+    num_steps,
+    out_theta,
+    out_r,
+):
+    """Run K independent ``_rollout`` calls in parallel. The parameters and
+    initial states carry a leading batch dimension K, and out_theta and
+    out_r have shape (K, num_steps, N)."""
+    for k in prange(theta0s.shape[0]):
+        theta = theta0s[k].copy()
+        r = r0s[k].copy()
+        _rollout(
+            theta,
+            r,
+            w_cos_phis[k],
+            w_sin_phis[k],
+            omegas[k],
+            Rs[k],
+            decays[k],
+            dt,
+            num_steps,
+            out_theta[k],
+            out_r[k],
+        )
+
+
+def rollout_batch(
+    timestep,
+    intrinsic_freqs,
+    intrinsic_amps,
+    coupling_weights,
+    phase_biases,
+    convergence_coefs,
+    init_phases,
+    init_magnitudes,
+    num_steps,
+):
+    """Simulate K independent CPG networks in parallel, e.g. to sweep gait
+    parameters. Each network is integrated like ``CPGNetwork.rollout``.
+
+    Parameters
+    ----------
+    timestep : float
+        The timestep of the simulation, shared by all networks.
+    intrinsic_freqs : np.ndarray
+        The intrinsic frequencies of the oscillators, shape (K, N).
+    intrinsic_amps : np.ndarray
+        The intrinsic amplitude of the oscillators, shape (K, N).
+    coupling_weights : np.ndarray
+        The coupling weights between the oscillators, shape (K, N, N).
+    phase_biases : np.ndarray
+        The phase biases between the oscillators, shape (K, N, N).
+    convergence_coefs : np.ndarray
+        Coefficients describing the rate of convergence to oscillator
+        intrinsic amplitudes, shape (K, N).
+    init_phases : np.ndarray
+        Initial phases of the oscillators, shape (K, N).
+    init_magnitudes : np.ndarray
+        Initial magnitudes of the oscillators, shape (K, N).
+    num_steps : int
+        The number of steps to simulate.
+
+    Returns
+    -------
+    phase_hist : np.ndarray
+        The phases after each step, shape (K, num_steps, N).
+    magnitude_hist : np.ndarray
+        The magnitudes after each step, shape (K, num_steps, N).
+    """
+    num_networks, num_cpgs = intrinsic_freqs.shape
+    assert intrinsic_amps.shape == (num_networks, num_cpgs)
+    assert coupling_weights.shape == (num_networks, num_cpgs, num_cpgs)
+    assert phase_biases.shape == (num_networks, num_cpgs, num_cpgs)
+    assert convergence_coefs.shape == (num_networks, num_cpgs)
+    assert init_phases.shape == (num_networks, num_cpgs)
+    assert init_magnitudes.shape == (num_networks, num_cpgs)
+
+    w_cos_phi, w_sin_phi, omega, _, decay = _derived_params(
+        timestep,
+        intrinsic_freqs,
+        intrinsic_amps,
+        coupling_weights,
+        phase_biases,
+        convergence_coefs,
+    )
+
+    phase_hist = np.empty((num_networks, num_steps, num_cpgs))
+    magnitude_hist = np.empty((num_networks, num_steps, num_cpgs))
+    _rollout_batch(
+        np.ascontiguousarray(init_phases, dtype=np.float64),
+        np.ascontiguousarray(init_magnitudes, dtype=np.float64),
+        w_cos_phi,
+        w_sin_phi,
+        omega,
+        np.ascontiguousarray(intrinsic_amps, dtype=np.float64),
+        decay,
+        timestep,
+        num_steps,
+        phase_hist,
+        magnitude_hist,
+    )
+    return phase_hist, magnitude_hist
+
 
 class CPGNetwork:
     def __init__(
@@ -60,6 +255,24 @@ class CPGNetwork:
         self.convergence_coefs = convergence_coefs
         self.random_state = np.random.RandomState(seed)
 
+        # Constant terms of the ODEs, computed once
+        (
+            self._w_cos_phi,
+            self._w_sin_phi,
+            self._omega,
+            self._alpha_R,
+            self._decay,
+        ) = _derived_params(
+            timestep,
+            intrinsic_freqs,
+            intrinsic_amps,
+            coupling_weights,
+            phase_biases,
+            convergence_coefs,
+        )
+        # Scratch buffer reused by every step to avoid per-step allocation
+        self._dtheta_dt = np.empty(self.num_cpgs)
+
         self.reset(init_phases, init_magnitudes)
 
         # Check if the parameters have the right shape
@@ -70,19 +283,115 @@ class CPGNetwork:
         assert self.curr_phases.shape == (self.num_cpgs,)
         assert self.curr_magnitudes.shape == (self.num_cpgs,)
 
+        # Trigger JIT compilation of the step kernel on a copy of the state
+        _cpg_step(
+            self.curr_phases.copy(),
+            self.curr_magnitudes.copy(),
+            self._w_cos_phi,
+            self._w_sin_phi,
+            self._omega,
+            self.intrinsic_amps,
+            self._decay,
+            self.timestep,
+            self._dtheta_dt,
+        )
+
     def step(self):
-        """Integrate the ODEs using Euler's method."""
-        dtheta_dt, dr_dt = calculate_ddt(
-            theta=self.curr_phases,
-            r=self.curr_magnitudes,
-            w=self.coupling_weights,
-            phi=self.phase_biases,
-            nu=self.intrinsic_freqs,
-            R=self.intrinsic_amps,
-            alpha=self.convergence_coefs,
+        """Integrate the phases using Euler's method and the magnitudes
+        using their closed-form solution."""
+        _cpg_step(
+            self.curr_phases,
+            self.curr_magnitudes,
+            self._w_cos_phi,
+            self._w_sin_phi,
+            self._omega,
+            self.intrinsic_amps,
+            self._decay,
+            self.timestep,
+            self._dtheta_dt,
+        )
+
+    def rollout(self, num_steps):
+        """Step the network num_steps times and return the history of the
+        phases and magnitudes after each step, both of shape (num_steps, N).
+        """
+        phase_hist = np.empty((num_steps, self.num_cpgs))
+        magnitude_hist = np.empty((num_steps, self.num_cpgs))
+        _rollout(
+            self.curr_phases,
+            self.curr_magnitudes,
+            self._w_cos_phi,
+            self._w_sin_phi,
+            self._omega,
+            self.intrinsic_amps,
+            self._decay,
+            self.timestep,
+            num_steps,
+            phase_hist,
+            magnitude_hist,
+        )
+        return phase_hist, magnitude_hist
+
+    def solve(self, t_eval, method="LSODA", rtol=1e-6, atol=1e-9):
+        """Integrate the ODEs from the current state with an adaptive
+        solver from ``scipy.integrate.solve_ivp``. The network state is set
+        to the solution at t_eval[-1].
+
+        Parameters
+        ----------
+        t_eval : np.ndarray
+            Strictly increasing, non-negative times, relative to the
+            current state, at which the solution is returned, shape (T,).
+            The last time must be greater than 0.
+        method : str, optional
+            The integration method passed to ``solve_ivp``.
+        rtol, atol : float, optional
+            The relative and absolute tolerances passed to ``solve_ivp``.
+
+        Returns
+        -------
+        phase_hist : np.ndarray
+            The phases at the times t_eval, shape (T, N).
+        magnitude_hist : np.ndarray
+            The magnitudes at the times t_eval, shape (T, N).
+        """
+        t_eval = np.asarray(t_eval, dtype=np.float64)
+        if (
+            t_eval.ndim != 1
+            or t_eval.size == 0
+            or t_eval[0] < 0
+            or t_eval[-1] <= 0
+            or np.any(np.diff(t_eval) <= 0)
+        ):
+            raise ValueError(
+                "t_eval must be a non-empty, strictly increasing 1-D array of "
+                "non-negative times ending after 0"
+            )
+
+        y0 = np.concatenate([self.curr_phases, self.curr_magnitudes])
+        sol = solve_ivp(
+            cpg_rhs,
+            (0.0, t_eval[-1]),
+            y0,
+            method=method,
+            t_eval=t_eval,
+            rtol=rtol,
+            atol=atol,
+            args=(
+                self._w_cos_phi,
+                self._w_sin_phi,
+                self._omega,
+                self.convergence_coefs,
+                self._alpha_R,
+            ),
         )
-        self.curr_phases += dtheta_dt * self.timestep
-        self.curr_magnitudes += dr_dt * self.timestep
+        if not sol.success:
+            raise RuntimeError(f"CPG integration failed: {sol.message}")
+        phase_hist = sol.y[: self.num_cpgs].T.copy()
+        magnitude_hist = sol.y[self.num_cpgs :].T.copy()
+        self.curr_phases[:] = phase_hist[-1]
+        self.curr_magnitudes[:] = magnitude_hist[-1]
+        return phase_hist, magnitude_hist
 
     def reset(self, init_phases=None, init_magnitudes=None):
         """Reset the phases and magnitudes of the oscillators.
@@ -91,9 +400,11 @@ class CPGNetwork:
         if init_phases is None:
             self.curr_phases = self.random_state.random(self.num_cpgs) * 2 * np.pi
         else:
-            self.curr_phases = init_phases
+            self.curr_phases = np.ascontiguousarray(init_phases, dtype=np.float64)
 
         if init_magnitudes is None:
             self.curr_magnitudes = np.zeros(self.num_cpgs)
         else:
-            self.curr_magnitudes = init_magnitudes
\ No newline at end of file
+            self.curr_magnitudes = np.ascontiguousarray(
+                init_magnitudes, dtype=np.float64
+            )
\ No newline at end of file
@@ -1,26 +1,37 @@
+import math
+
 import numpy as np
 
 def get_go1_target_angles(phase, amplitude):
     """
     CPGの位相(0~2π)を受け取り、Go1の片足3関節の角度を計算する
-    戻り値: [Hip, Thigh, Calf] の角度
+    phase, amplitude は形状 (T,) の配列 (どちらかはスカラでもよい)
+    戻り値: [Hip, Thigh, Calf] の角度 (形状 (3, T))
     """
     s = np.sin(phase)
 
     # 1. Hip (股関節・横)
-    angle_hip = 0.0
+    angle_hip = np.zeros(np.broadcast(s, amplitude).shape)
 
     # 2. Thigh (太もも)
-    # 0.9 rad を基準に振る
+    # 0.8 rad を基準に振る
     angle_thigh = 0.8 - (amplitude * 0.3) * s
 
     # 3. Calf (膝)
+    # s > 0 なら足上げ期、それ以外は接地期 (基準値のまま)
     base_calf = -1.6
-    if s > 0:
-        # 足上げ期
-        angle_calf = base_calf - (amplitude * 0.7) * s
-    else:
-        # 接地期
-        angle_calf = base_calf
+    angle_calf = np.where(s > 0, base_calf - (amplitude * 0.7) * s, base_calf)
+
+    return np.stack([angle_hip, angle_thigh, angle_calf], axis=0)
 
-    return np.array([angle_hip, angle_thigh, angle_calf])
\ No newline at end of file
+def get_go1_target_angles_scalar(phase, amplitude):
+    """
+    get_go1_target_angles のスカラ版 (式は同じ)
+    スカラ入力では np.sin / np.array の呼び出しコストの方が大きいので、
+    math.sin で計算して配列を作らずにタプルで返す
+    戻り値: (Hip, Thigh, Calf) の角度
+    """
+    s = math.sin(phase)
+    angle_thigh = 0.8 - (amplitude * 0.3) * s
+    angle_calf = -1.6 - (amplitude * 0.7) * s if s > 0 else -1.6
+    return 0.0, angle_thigh, angle_calf
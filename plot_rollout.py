@@ -34,13 +34,11 @@ network = CPGNetwork(
 duration = 2.0  # 2秒間シミュレーション
 num_steps = int(duration / network.timestep)
 
-phase_hist = np.empty((num_steps, 4))      # 6足→4足に変更
-magnitude_hist = np.empty((num_steps, 4))  # 6足→4足に変更
-
-for i in range(num_steps):
-    network.step()
-    phase_hist[i, :] = network.curr_phases
-    magnitude_hist[i, :] = network.curr_magnitudes
+# プロット用なので、Euler法ではなく可変ステップの solve_ivp (LSODA) で積分し、
+# 各ステップ後の時刻 (dt, 2dt, ...) の値だけを取り出します
+# phase_hist, magnitude_hist の形状は (num_steps, 4) (6足→4足に変更)
+t_eval = (np.arange(num_steps) + 1) * network.timestep
+phase_hist, magnitude_hist = network.solve(t_eval)
 
 # --- 3. Visualize (元のコードのスタイルを維持) ---
 fig, axs = plt.subplots(2, 1, figsize=(5, 5), sharex=True)
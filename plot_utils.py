@@ -0,0 +1,78 @@
+import matplotlib
+
+# GUIバックエンドを読み込まないよう、pyplot より先に Agg を指定します
+# (画像を保存するだけなので画面表示は不要です)
+matplotlib.use("Agg")
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Go1の関節定義
+legs = [f"{pos}{side}" for side in "LR" for pos in "FR"] # FL, RL, FR, RR
+dofs_per_leg = [
+    "Hip",
+    "Thigh",
+    "Calf",
+]
+
+def make_gait_figure(theta_ts, joint_angles, out_path):
+    """
+    各足の関節角度 (rad) を位相に対して (2x2) のグラフに描き、out_path に保存する
+    joint_angles: 形状 (4, 3, T) の角度配列 ([足 (legs の順), 関節, 時間])
+    """
+    # 度数法への変換は全体に対して一度だけ行います
+    joint_angles_deg = np.rad2deg(joint_angles)
+
+    # Flyは6本足(3x2)でしたが、Go1は4本足なので(2x2)にします
+    fig, axs = plt.subplots(2, 2, figsize=(7, 5), sharex=True, sharey=True)
+
+    # "LR" (左右) と "FR" (前後) でループを回すスタイルを維持
+    for i_side, side in enumerate("LR"):     # 0:L, 1:R
+        for i_pos, pos in enumerate("FR"):   # 0:F, 1:R (Rear)
+            
+            # Go1の命名規則 (FL, FR, RL, RR) に合わせる
+            leg = f"{pos}{side}" 
+            
+            # サブプロットの選択
+            ax = axs[i_pos, i_side]
+            
+            # legs の並び順での番号
+            i_leg = legs.index(leg)
+            
+            for i_dof, dof_name in enumerate(dofs_per_leg):
+                # 凡例は左上(0,0)だけに表示
+                legend = dof_name if i_pos == 0 and i_side == 0 else None
+                
+                # プロット
+                ax.plot(
+                    theta_ts, joint_angles_deg[i_leg, i_dof], linewidth=1, label=legend
+                )
+
+            # X軸の設定 (一番下の行だけ)
+            if i_pos == 1: 
+                ax.set_xlabel("Phase")
+                ax.set_xticks(np.pi * np.arange(7))
+                ax.set_xticklabels(["0" if x == 0 else rf"{x}$\pi$" for x in np.arange(7)])
+            
+            # Y軸の設定 (一番左の列だけ)
+            if i_side == 0:
+                ax.set_ylabel(r"DoF angle ($\degree$)")
+            
+            # タイトル
+            ax.set_title(f"{leg} leg")
+            
+            # 範囲設定
+            # Go1の可動域に合わせて調整 (-180~180だとスカスカになるため狭めています)
+            ax.set_ylim(-100, 100)
+            ax.set_yticks([-90, -45, 0, 45, 90])
+            ax.grid(True, linestyle=":", alpha=0.6)
+
+    # 凡例とレイアウト調整
+    fig.legend(loc="center right") # 位置調整
+    fig.tight_layout()
+    fig.subplots_adjust(right=0.8) # 凡例スペース確保
+
+    # 保存
+    fig.savefig(out_path)
+    plt.close(fig)
+    print(f"グラフを保存しました: {out_path}")
@@ -1,12 +1,14 @@
+import argparse
+import contextlib
 import numpy as np
 from cpgnet import CPGNetwork
-from kinematics import get_go1_target_angles
+from kinematics import get_go1_target_angles_scalar
 import time
 import mujoco
 import mujoco.viewer
 import imageio  # 動画保存用
 
-def main():
+def main(headless=False):
     # --- CPGの設定 (Trot) ---
     intrinsic_freqs = np.ones(4) * 6.0
     intrinsic_amps = np.ones(4) * 1.0
@@ -43,7 +45,6 @@ def main():
     # --- 3. 録画とカメラの設定 ---
     # 動画保存用のレンダラーを作成
     renderer = mujoco.Renderer(model, height=480, width=640)
-    frames = [] # ここに画像をためていく
     
     # シミュレーション時間とフレームレート
     duration = 5.0      # シミュレーションする時間（秒）
@@ -67,7 +68,17 @@ def main():
     print(f"シミュレーション開始 ({duration}秒間)...")
 
     # Viewerを立ち上げる（画面で見る用）
-    with mujoco.viewer.launch_passive(model, data) as viewer:
+    # headless のときは Viewer を起動せず、録画用のレンダラーだけを使います
+    if headless:
+        viewer_context = contextlib.nullcontext()
+    else:
+        viewer_context = mujoco.viewer.launch_passive(model, data)
+
+    # 画像をメモリにためずに、撮ったそばから動画ファイルに書き込みます
+    # with を抜けるときに (例外や Ctrl-C で止まった場合も) 動画ファイルが閉じられます
+    with viewer_context as viewer, imageio.get_writer(
+        "trot.mp4", fps=playback_fps, codec="libx264"
+    ) as writer:
         
         # 1. 本体の高さを調整 (0.35だと高いので 0.29 くらいにします)
         # ※足が地面にちょうどつく高さです
@@ -78,17 +89,22 @@ def main():
         # したがって、qpos[7] から後ろがモーターの角度です。
         
         # [Hip, Thigh, Calf] の順で、kinematics.pyの基準値と同じにします
-        # Thigh=0.8, Calf=-1.6 (前回の修正値を反映)
-        standing_pose = [0.0, 0.8, -1.6] 
+        # (振幅0の姿勢 = Hip=0.0, Thigh=0.8, Calf=-1.6)
+        standing_pose = get_go1_target_angles_scalar(0.0, 0.0)
         
         # 4足分 (12個) のデータを一気に入れます
         # FR, FL, RR, RL すべて同じ姿勢でスタートさせます
         data.qpos[7:19] = np.tile(standing_pose, 4)
         
         # カメラ設定（初期視点）
-        viewer.cam.distance = 1.5  # カメラの距離
-        viewer.cam.elevation = -20 # カメラの高さ角度
-        viewer.cam.azimuth = 90    # 横方向の角度
+        # headless のときは Viewer のカメラの代わりに同じ設定のカメラを作ります
+        cam = mujoco.MjvCamera() if viewer is None else viewer.cam
+        cam.distance = 1.5  # カメラの距離
+        cam.elevation = -20 # カメラの高さ角度
+        cam.azimuth = 90    # 横方向の角度
+
+        # data.ctrl に直接書き込むことで、毎ステップ配列を作らずに済みます
+        ctrl_signal = data.ctrl
 
         # メインループ
         for i in range(total_steps):
@@ -97,41 +113,47 @@ def main():
             cpg.step()
             
             # --- B. マッピング ---
-            ctrl_signal = np.zeros(12)
+            # 4本程度ならNumPyで一括計算するより、Pythonのfloatとmath.sinで
+            # 1本ずつ計算する方が速いので、スカラ版を使います
+            phases = cpg.curr_phases.tolist()
+            magnitudes = cpg.curr_magnitudes.tolist()
             # FR(0-2) <- CPG[2], FL(3-5) <- CPG[0], RR(6-8) <- CPG[3], RL(9-11) <- CPG[1]
-            ctrl_signal[0:3] = get_go1_target_angles(cpg.curr_phases[2], cpg.curr_magnitudes[2])
-            ctrl_signal[3:6] = get_go1_target_angles(cpg.curr_phases[0], cpg.curr_magnitudes[0])
-            ctrl_signal[6:9] = get_go1_target_angles(cpg.curr_phases[3], cpg.curr_magnitudes[3])
-            ctrl_signal[9:12] = get_go1_target_angles(cpg.curr_phases[1], cpg.curr_magnitudes[1])
-            
-            data.ctrl[:] = ctrl_signal
+            ctrl_signal[0:3] = get_go1_target_angles_scalar(phases[2], magnitudes[2])
+            ctrl_signal[3:6] = get_go1_target_angles_scalar(phases[0], magnitudes[0])
+            ctrl_signal[6:9] = get_go1_target_angles_scalar(phases[3], magnitudes[3])
+            ctrl_signal[9:12] = get_go1_target_angles_scalar(phases[1], magnitudes[1])
             
             # --- C. 物理演算 ---
             mujoco.mj_step(model, data)
 
-            # --- D. カメラ追従 (Tracking) ---
-            # ロボットの現在位置(x, y, z)を取得
-            robot_pos = data.qpos[0:3]
-            
-            # Viewerのカメラ中心をロボットに合わせる
-            viewer.cam.lookat[:] = robot_pos
-
-            # --- E. 画面更新と録画 ---
+            # --- D. カメラ追従と画面更新・録画 ---
+            # カメラ位置は描画するフレームにしか影響しないので、描画するときだけ更新します
             if i % render_interval == 0:
-                # 1. 画面(Viewer)の更新
-                viewer.sync()
+                # 1. カメラ中心をロボットの現在位置(x, y, z)に合わせる
+                cam.lookat[:] = data.qpos[0:3]
+                
+                # 2. 画面(Viewer)の更新
+                if viewer is not None:
+                    viewer.sync()
                 
-                # 2. 録画用レンダラーのカメラも更新
-                renderer.update_scene(data, camera=viewer.cam)
+                # 3. 録画用レンダラーも同じカメラで更新
+                renderer.update_scene(data, camera=cam)
                 
-                # 3. 画像を取得してリストに追加
+                # 4. 画像を取得して動画ファイルに追記
                 frame = renderer.render()
-                frames.append(frame)
+                writer.append_data(frame)
+
+        # --- 4. 動画の保存 (with を抜けるときにファイルが閉じられます) ---
+        print("動画を保存しています")
 
-    # --- 4. 動画として保存 ---
-    print("動画を保存しています")
-    imageio.mimsave("trot.mp4", frames, fps=playback_fps)
     print("完了！")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Viewer を起動せず、動画 (trot.mp4) の保存だけを行う",
+    )
+    args = parser.parse_args()
+    main(headless=args.headless)
\ No newline at end of file